@@ -1,16 +1,17 @@
 import asyncio
 import logging
-from fastapi_limiter import FastAPILimiter
 import uvicorn
 from fastapi import FastAPI, BackgroundTasks
+from fastapi.responses import ORJSONResponse
 from starlette.middleware.cors import CORSMiddleware
 from starlette.staticfiles import StaticFiles
-import redis.asyncio as redis
 
 
+from src.database.cache import redis_pool
 from src.routes import contact, auth, users
+from src.services.rate_limit import load_rate_limit_script
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -18,15 +19,11 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 app.mount("/static", StaticFiles(directory="src/static"), name="static")
 
-app.include_router(auth.router)
-app.include_router(contact.router, prefix='/api')
-
-
-
 app.include_router(auth.router, prefix='/api')
 app.include_router(contact.router, prefix='/api')
 app.include_router(users.router, prefix='/api')
@@ -38,8 +35,12 @@ async def task():
 
 @app.on_event("startup")
 async def startup():
-    r = await redis.Redis(host='localhost', port=6379, db=0, encoding="utf-8", decode_responses=True)
-    await FastAPILimiter.init(r)
+    await load_rate_limit_script(app)
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    await redis_pool.disconnect()
 
 
 @app.get("/")
@@ -49,4 +50,4 @@ async def read_root(background_tasks: BackgroundTasks):
 
 
 if __name__ == '__main__':
-    uvicorn.run("main:app", host="localhost", reload=True, log_level="info")
+    uvicorn.run("main:app", host="localhost", loop="uvloop", http="httptools", workers=4, log_level="info")
@@ -0,0 +1,26 @@
+"""add contacts birthday mmdd index
+
+Revision ID: 4e81c0d7b925
+Revises: 9d3b6f1a2c47
+Create Date: 2026-10-15 10:41:07.182934
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4e81c0d7b925'
+down_revision = '9d3b6f1a2c47'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_contacts_user_id_bday_mmdd', 'contacts',
+                    ['user_id', sa.text("(date_part('month', birthday) * 100 + date_part('day', birthday))")],
+                    unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_contacts_user_id_bday_mmdd', table_name='contacts')
@@ -3,6 +3,9 @@ from pydantic import BaseSettings
 
 class Settings(BaseSettings):
     sqlalchemy_database_url: str
+    # Per uvicorn worker: workers x (db_pool_size + db_max_overflow) must stay below Postgres max_connections
+    db_pool_size: int = 10
+    db_max_overflow: int = 10
     secret_key: str
     algorithm: str
     mail_username: str
@@ -0,0 +1,9 @@
+import redis.asyncio as redis
+
+from src.conf.config import settings
+
+redis_pool = redis.ConnectionPool(host=settings.redis_host, port=settings.redis_port, db=0, encoding="utf-8",
+                                  decode_responses=True, max_connections=64, socket_connect_timeout=5,
+                                  socket_timeout=5)
+redis_client = redis.Redis(connection_pool=redis_pool)
+
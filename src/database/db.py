@@ -3,6 +3,7 @@ from typing import AsyncIterator
 
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from src.conf import config
 
@@ -13,17 +14,29 @@ class DatabaseSessionManager:
     """
     The DatabaseSessionManager class is responsible for managing database sessions.
 
+    The engine keeps a pool of asyncpg connections open, so requests reuse an
+    established connection instead of paying the connect/auth handshake each time.
+
     Parameters:
     - url (str): The URL of the database.
+    - pool_size (int): The number of connections kept open in the pool.
+    - max_overflow (int): The number of extra connections allowed above pool_size.
+    - pool_recycle (int): The number of seconds after which a connection is recycled.
 
     Attributes:
     - _engine (AsyncEngine | None): The asynchronous database engine.
     - _session_maker (async_sessionmaker | None): The asynchronous session maker.
     """
 
-    def __init__(self, url: str):
-        self._engine: AsyncEngine | None = create_async_engine(url)
+    def __init__(self, url: str, pool_size: int = 10, max_overflow: int = 10, pool_recycle: int = 1800):
+        if url.startswith("postgresql://"):
+            url = url.replace("postgresql://", "postgresql+asyncpg://", 1)
+        self._engine: AsyncEngine | None = create_async_engine(url, poolclass=AsyncAdaptedQueuePool,
+                                                               pool_size=pool_size, max_overflow=max_overflow,
+                                                               pool_pre_ping=True, pool_recycle=pool_recycle,
+                                                               query_cache_size=1200)
         self._session_maker: async_sessionmaker | None = async_sessionmaker(autocommit=False, autoflush=False,
+                                                                            expire_on_commit=False,
                                                                             bind=self._engine)
 
     @contextlib.asynccontextmanager
@@ -46,13 +59,18 @@ class DatabaseSessionManager:
             await session.close()
 
 
-sessionmanager = DatabaseSessionManager(config.DB_URL)
+sessionmanager = DatabaseSessionManager(config.settings.sqlalchemy_database_url,
+                                        pool_size=config.settings.db_pool_size,
+                                        max_overflow=config.settings.db_max_overflow)
 
 
 async def get_db() -> AsyncIterator[AsyncSession]:
     """
     The get_db function is a context manager that returns an asynchronous session.
 
+    FastAPI caches dependencies per request, so auth_service.get_current_user and the route handler
+    receive this same session. It checks out at most one pooled connection, on its first query.
+
     Yields:
     - session (AsyncSession): An asynchronous database session.
     """
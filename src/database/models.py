@@ -1,7 +1,7 @@
 import enum
 from datetime import date
 
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, DateTime, func, Enum
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, DateTime, func, Enum, Index, literal_column
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.database.db import Base
@@ -21,7 +21,7 @@ class Contact(Base):
        - created_date (datetime): The date when the contact was created.
        - update_date (datetime): The date when the contact was last updated.
        - user_id (int): The ID of the user associated with the contact.
-       - user (User): The associated User object.
+       - user (User): The associated User object (never lazy-loaded; use selectinload).
        """
 
     __tablename__ = 'contacts'
@@ -36,7 +36,17 @@ class Contact(Base):
     update_date: Mapped[date] = Column(DateTime, default=date.today, nullable=True)
 
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=True)
-    user: Mapped["User"] = relationship('User', backref="contacts")
+    user: Mapped["User"] = relationship('User', back_populates="contacts", lazy="raise_on_sql")
+
+
+Index("ix_contacts_user_id_id", Contact.user_id, Contact.id)
+
+# Year-agnostic birthday as an integer MMDD (e.g. 1231), indexed per user for upcoming-birthday lookups.
+# Constants are literal (not bound parameters) so the query expression matches the index expression.
+birthday_mmdd = (func.date_part(literal_column("'month'"), Contact.birthday) * literal_column("100", Integer)
+                 + func.date_part(literal_column("'day'"), Contact.birthday))
+# date_part() is PostgreSQL-specific, so other backends (e.g. the SQLite test database) skip this index
+Index("ix_contacts_user_id_bday_mmdd", Contact.user_id, birthday_mmdd).ddl_if(dialect="postgresql")
 
 
 class User(Base):
@@ -53,6 +63,7 @@ class User(Base):
        - avatar (str): The path to the user's avatar.
        - refresh_token (str): The refresh token associated with the user.
        - confirmed (bool): Indicates if the user's account is confirmed.
+       - contacts (list[Contact]): The user's contacts (never lazy-loaded; use selectinload).
        """
 
     __tablename__ = "users"
@@ -65,3 +76,4 @@ class User(Base):
     avatar: Mapped[str] = mapped_column(String(255), nullable=True)
     refresh_token: Mapped[str] = mapped_column(String(255), nullable=True)
     confirmed: Mapped[bool] = mapped_column(Boolean, default=False)
+    contacts: Mapped[list["Contact"]] = relationship('Contact', back_populates="user", lazy="raise_on_sql")
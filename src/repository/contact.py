@@ -1,27 +1,31 @@
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload, Session
 from sqlalchemy import func
 
-from sqlalchemy import select
+from sqlalchemy import select, or_, insert, update, lambda_stmt
+from sqlalchemy.orm.attributes import set_committed_value
 
-from src.database.models import Contact, User
+from src.database.models import Contact, User, birthday_mmdd
 from src.schemas import ContactSchema, ContactUpdateSchema
 
 
-async def get_contacts(limit: int, offset: int, db: AsyncSession, user: User):
+async def get_contacts(limit: int, after_id: int | None, db: AsyncSession, user: User):
     """
-        The get_contacts function returns a list of contacts for the user.
+        The get_contacts function returns a page of contacts for the user, ordered by id.
 
         :param limit: int: Limit the number of contacts returned
-        :param offset: int: Specify the offset of the query
+        :param after_id: int | None: Return only contacts with an id greater than this cursor
         :param db: AsyncSession: Pass in the database session
         :param user: User: Get the contacts for a specific user
         :return: A list of contact objects
         :doc-author: Trelent
     """
-    sq = select(Contact).filter_by(user=user).offset(offset).limit(limit)
+    user_id = user.id
+    after = after_id or 0
+    sq = lambda_stmt(lambda: select(Contact).options(selectinload(Contact.user)))
+    sq += lambda s: s.where(Contact.user_id == user_id, Contact.id > after).order_by(Contact.id).limit(limit)
     contacts = await db.execute(sq)
     return contacts.scalars().all()
 
@@ -35,7 +39,10 @@ async def get_contact(contact_id: int, db: AsyncSession, user: User):
         :param user: User: Get the user from the database
         :return: A contact object
     """
-    contact = await db.execute(select(Contact).where(Contact.id == contact_id, user=user))
+    user_id = user.id
+    sq = lambda_stmt(lambda: select(Contact).options(selectinload(Contact.user)))
+    sq += lambda s: s.where(Contact.id == contact_id, Contact.user_id == user_id)
+    contact = await db.execute(sq)
     return contact.scalars().first()
 
 
@@ -58,13 +65,14 @@ async def create_contact(body: ContactSchema, db: AsyncSession, user: User):
         "email": body.email,
         "phone_number": body.phone_number,
         "birthday": body.birthday,
-        "created_date": body.created_date
+        "created_date": date.today()
     }
 
-    contact = Contact(**contact_data, user=user)
-    db.add(contact)
+    stmt = insert(Contact).values(**contact_data, user_id=user.id).returning(Contact)
+    result = await db.execute(stmt)
+    contact = result.scalar_one()
     await db.commit()
-    await db.refresh(contact)
+    set_committed_value(contact, "user", user)
     return contact
 
 
@@ -81,28 +89,27 @@ async def update_contact(contact_id: int, body: ContactUpdateSchema, db: AsyncSe
         Returns:
         - contact: The updated Contact object or None if not found.
         """
-    sq = select(Contact).filter_by(id=contact_id, user=user)
-    result = await db.execute(sq)
+    stmt = (
+        update(Contact)
+        .where(Contact.id == contact_id, Contact.user_id == user.id)
+        .values(first_name=body.first_name, last_name=body.last_name, email=body.email,
+                phone_number=body.phone_number, birthday=body.birthday, update_date=date.today())
+        .returning(Contact)
+    )
+    result = await db.execute(stmt)
     contact = result.scalar_one_or_none()
     if contact:
-        contact.first_name = body.first_name
-        contact.last_name = body.last_name
-        contact.email = body.email
-        contact.phone_number = body.phone_number
-        contact.birthday = body.birthday
-        contact.update_date = body.update_date
         await db.commit()
-        await db.refresh(contact)
+        set_committed_value(contact, "user", user)
     return contact
 
 
-async def remove_contact(contact_id: int, body: ContactSchema, db: AsyncSession, user: User):
+async def remove_contact(contact_id: int, db: AsyncSession, user: User):
     """
         Remove a contact from the database.
 
         Parameters:
         - contact_id (int): The ID of the contact to remove.
-        - body (ContactSchema): The contact data.
         - db (AsyncSession): The asynchronous database session.
         - user (User): The associated User object.
 
@@ -110,7 +117,9 @@ async def remove_contact(contact_id: int, body: ContactSchema, db: AsyncSession,
         - contact: The removed Contact object or None if not found.
         """
 
-    sq = select(Contact).filter_by(id=contact_id, user=user)
+    user_id = user.id
+    sq = lambda_stmt(lambda: select(Contact).options(selectinload(Contact.user)))
+    sq += lambda s: s.where(Contact.id == contact_id, Contact.user_id == user_id)
     result = await db.execute(sq)
     contact = result.scalar_one_or_none()
     if contact:
@@ -119,20 +128,52 @@ async def remove_contact(contact_id: int, body: ContactSchema, db: AsyncSession,
     return contact
 
 
-async def get_upcoming_birthdays(db):
+def upcoming_birthday_window(today: date, days: int = 7) -> tuple[int, int]:
+    """
+     Compute the upcoming-birthday window as integer MMDD bounds.
+
+     Parameters:
+     - today (date): The first day of the window.
+     - days (int): The number of days the window spans after today.
+
+     Returns:
+     - tuple[int, int]: The start and end MMDD; end is smaller than start when the window wraps over New Year.
+     """
+    end_date = today + timedelta(days=days)
+    return today.month * 100 + today.day, end_date.month * 100 + end_date.day
+
+
+def upcoming_birthday_filter(today: date, days: int = 7):
     """
-     Retrieve upcoming birthdays within the next 7 days.
+     Build the SQL condition matching birthdays within the window starting today, regardless of birth year.
+
+     Parameters:
+     - today (date): The first day of the window.
+     - days (int): The number of days the window spans after today.
+
+     Returns:
+     - ColumnElement[bool]: The condition on Contact.birthday.
+     """
+    start_mmdd, end_mmdd = upcoming_birthday_window(today, days)
+    if end_mmdd >= start_mmdd:
+        return birthday_mmdd.between(start_mmdd, end_mmdd)
+    # The window wraps over New Year
+    return or_(birthday_mmdd >= start_mmdd, birthday_mmdd <= end_mmdd)
+
+
+async def get_upcoming_birthdays(db: AsyncSession, user: User):
+    """
+     Retrieve the user's contacts whose birthdays fall within the next 7 days, regardless of birth year.
 
      Parameters:
      - db (AsyncSession): The asynchronous database session.
+     - user (User): The associated User object.
 
      Returns:
      - List[Contact]: A list of Contact objects representing upcoming birthdays.
      """
-    today = datetime.now().date()
-    end_date = today + timedelta(days=7)
-
-    contacts = select(Contact).where(Contact.birthday >= today).where(Contact.birthday <= end_date)
+    in_window = upcoming_birthday_filter(datetime.now().date())
+    contacts = select(Contact).options(selectinload(Contact.user)).where(Contact.user_id == user.id, in_window)
     result = await db.execute(contacts)
 
     upcoming_birthdays = result.scalars().all()
@@ -1,17 +1,44 @@
+import json
 import logging
 
 from libgravatar import Gravatar
-from sqlalchemy import select
+from redis.exceptions import RedisError
+from sqlalchemy import Row, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
 
+from src.database.cache import redis_client
 from src.database.models import User
 from src.schemas import UserSchema
 
+USER_CACHE_TTL = 60
+USER_CACHE_FIELDS = ("id", "username", "email", "password", "avatar", "refresh_token", "confirmed")
+
+
+def _user_cache_key(email: str) -> str:
+    return f"user:{email}"
+
+
+async def _invalidate_user_cache(email: str) -> None:
+    """
+    Drop the cached copy of a user so the next lookup reads it from the database.
+
+    :param email: str: The email address of the cached user
+    """
+    try:
+        await redis_client.delete(_user_cache_key(email))
+    except RedisError as e:
+        logging.error(e)
+
 
 async def get_user_by_email(email: str, db: AsyncSession) -> User:
     """
         Retrieve a user by their email address.
 
+        The user is cached in Redis for USER_CACHE_TTL seconds. A cached user is returned
+        detached from the session, so changes to it must be written with an UPDATE statement.
+
         Parameters:
         - email (str): The email address of the user to retrieve.
         - db (AsyncSession): The asynchronous database session.
@@ -19,13 +46,46 @@ async def get_user_by_email(email: str, db: AsyncSession) -> User:
         Returns:
         - User | None: The retrieved User object or None if not found.
         """
+    key = _user_cache_key(email)
+    try:
+        cached = await redis_client.get(key)
+    except RedisError as e:
+        logging.error(e)
+        cached = None
+    if cached is not None:
+        user = User(**json.loads(cached))
+        make_transient_to_detached(user)
+        return user
+
     sq = select(User).filter_by(email=email)
     result = await db.execute(sq)
     user = result.scalar_one_or_none()
     logging.info(user)
+    if user is not None:
+        try:
+            await redis_client.setex(key, USER_CACHE_TTL,
+                                     json.dumps({field: getattr(user, field) for field in USER_CACHE_FIELDS}))
+        except RedisError as e:
+            logging.error(e)
     return user
 
 
+async def get_user_auth_fields(email: str, db: AsyncSession) -> Row | None:
+    """
+        Retrieve only the columns needed to authenticate a user by their email address.
+
+        Parameters:
+        - email (str): The email address of the user to retrieve.
+        - db (AsyncSession): The asynchronous database session.
+
+        Returns:
+        - Row | None: A row with id, email, password and confirmed, or None if not found.
+        """
+    sq = select(User.id, User.email, User.password, User.confirmed).filter_by(email=email)
+    result = await db.execute(sq)
+    return result.one_or_none()
+
+
 async def create_user(body: UserSchema, db: AsyncSession) -> User:
     """
     The create_user function creates a new user in the database.
@@ -43,23 +103,25 @@ async def create_user(body: UserSchema, db: AsyncSession) -> User:
     new_user = User(**body.model_dump(), avatar=avatar)  # User(username=username, email=email, password=password)
     db.add(new_user)
     await db.commit()
-    await db.refresh(new_user)
     return new_user
 
 
-async def update_token(user: User, token: str | None, db: AsyncSession) -> None:
+async def update_token(user: User | Row, token: str | None, db: AsyncSession) -> None:
     """
     The update_token function updates the refresh token for a user.
 
-        :param user: User: Identify the user that is being updated
+        :param user: User | Row: Identify the user that is being updated (needs id and email)
         :param token: str | None: Update the user's refresh token
         :param db: AsyncSession: Pass the database session to the function
 
         return: None, updates the user's refresh token in the database
 
     """
-    user.refresh_token = token
+    await db.execute(update(User).where(User.id == user.id).values(refresh_token=token))
     await db.commit()
+    if isinstance(user, User):
+        set_committed_value(user, "refresh_token", token)
+    await _invalidate_user_cache(user.email)
 
 
 async def confirmed_email(email: str, db: AsyncSession) -> None:
@@ -73,9 +135,9 @@ async def confirmed_email(email: str, db: AsyncSession) -> None:
     return: None ,updates the user's confirmed status to true
 
     """
-    user = await get_user_by_email(email, db)
-    user.confirmed = True
+    await db.execute(update(User).where(User.email == email).values(confirmed=True))
     await db.commit()
+    await _invalidate_user_cache(email)
 
 
 async def update_avatar(email, url: str, db: AsyncSession) -> User:
@@ -88,7 +150,8 @@ async def update_avatar(email, url: str, db: AsyncSession) -> User:
 
     return: A user object
     """
-    user = await get_user_by_email(email, db)
-    user.avatar = url
-    db.commit()
+    result = await db.execute(update(User).where(User.email == email).values(avatar=url).returning(User))
+    user = result.scalar_one_or_none()
+    await db.commit()
+    await _invalidate_user_cache(email)
     return user
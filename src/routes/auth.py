@@ -1,12 +1,18 @@
+import asyncio
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
 from fastapi import APIRouter, HTTPException, Depends, status, Security, Request
 from fastapi.security import OAuth2PasswordRequestForm, HTTPAuthorizationCredentials, HTTPBearer
+from redis.exceptions import RedisError
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.background import BackgroundTasks
 from starlette.responses import RedirectResponse
 from src.services.email import send_email
 
+from src.database.cache import redis_client
 from src.database.db import get_db
 from src.schemas import UserSchema, UserResponseSchema, TokenModel
 from src.repository import users as repository_users
@@ -14,6 +20,8 @@ from src.services.auth import auth_service
 
 router = APIRouter(prefix='/auth', tags=["auth"])
 security = HTTPBearer()
+# argon2 and bcrypt release the GIL while hashing, so a thread pool keeps them off the event loop
+_hash_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
 
 
 @router.post("/signup", response_model=UserResponseSchema, status_code=status.HTTP_201_CREATED)
@@ -35,7 +43,8 @@ async def signup(body: UserSchema, background_tasks: BackgroundTasks, request: R
     exist_user = await repository_users.get_user_by_email(body.email, db)
     if exist_user:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Account already exists")
-    body.password = auth_service.get_password_hash(body.password)
+    body.password = await asyncio.get_running_loop().run_in_executor(_hash_pool, auth_service.get_password_hash,
+                                                                      body.password)
     new_user = await repository_users.create_user(body, db)
     background_tasks.add_task(send_email, new_user.email, new_user.username, str(request.base_url))
     return {"user": new_user, "detail": "User successfully created"}
@@ -53,14 +62,27 @@ async def login(body: OAuth2PasswordRequestForm = Depends(), db: AsyncSession =
        Returns:
        - dict: A dictionary containing access and refresh tokens.
        """
-    user = await repository_users.get_user_by_email(body.username, db)
+    user = await repository_users.get_user_auth_fields(body.username, db)
     # Only for publicly available services
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid email")
     if not user.confirmed:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Email not confirmed")
-    if not auth_service.verify_password(body.password, user.password):
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid password")
+    # A login verified moments ago (e.g. a client retry) skips re-hashing the password
+    login_key = auth_service.login_cache_key(user.email, body.password, user.password)
+    try:
+        login_cached = await redis_client.exists(login_key)
+    except RedisError as e:
+        logging.error(e)
+        login_cached = False
+    if not login_cached:
+        if not await asyncio.get_running_loop().run_in_executor(_hash_pool, auth_service.verify_password,
+                                                                body.password, user.password):
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid password")
+        try:
+            await redis_client.setex(login_key, auth_service.LOGIN_CACHE_TTL, 1)
+        except RedisError as e:
+            logging.error(e)
     # Generate JWT
     access_token = await auth_service.create_access_token(data={"sub": user.email})
     refresh_token = await auth_service.create_refresh_token(data={"sub": user.email})
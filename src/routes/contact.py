@@ -1,7 +1,6 @@
 from typing import List
 
-from fastapi import APIRouter, HTTPException, Depends, status, Path, Query
-from fastapi_limiter.depends import RateLimiter
+from fastapi import APIRouter, HTTPException, Depends, status, Path, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
@@ -10,50 +9,36 @@ from src.database.models import User
 from src.schemas import ContactResponse, ContactSchema, ContactUpdateSchema
 from src.repository import contact as repository_contacts
 from src.services.auth import auth_service
+from src.services.rate_limit import RateLimiter
 
 router = APIRouter(prefix='/contacts', tags=["contacts"])
 
 
 @router.get("/", response_model=List[ContactResponse], description='No more than 10 requests per minute',
             dependencies=[Depends(RateLimiter(times=10, seconds=60))])
-async def read_contacts(skip: int = 0, limit: int = 100, db: Session = Depends(get_db),
+async def read_contacts(response: Response, cursor: int | None = Query(None, ge=0),
+                        limit: int = Query(100, ge=1, le=100), db: Session = Depends(get_db),
                         current_user: User = Depends(auth_service.get_current_user)):
     """
-        Retrieve a list of contacts.
+        Retrieve a page of contacts ordered by ID.
 
         Parameters:
-        - skip (int): The number of contacts to skip.
-        - limit (int): The maximum number of contacts to retrieve.
+        - response (Response): The outgoing response, used to set the X-Next-Cursor header.
+        - cursor (int | None): The ID of the last contact of the previous page; omit for the first page.
+        - limit (int): The maximum number of contacts to retrieve (1-100).
         - db (Session): The database session.
         - current_user (User): The authenticated User object.
 
         Returns:
         - List[ContactResponse]: A list of ContactResponse objects representing contacts.
+          The X-Next-Cursor header holds the cursor for the next page and is omitted on the last page.
         """
-    contacts = await repository_contacts.get_contacts(skip, limit, current_user, db)
+    contacts = await repository_contacts.get_contacts(limit, cursor, db, current_user)
+    if len(contacts) == limit:
+        response.headers["X-Next-Cursor"] = str(contacts[-1].id)
     return contacts
 
 
-@router.get("/", response_model=List[ContactResponse], description='No more than 10 requests per minute',
-            dependencies=[Depends(RateLimiter(times=10, seconds=60))])
-async def get_all(limit: int = 10, offset: int = 0, db: AsyncSession = Depends(get_db),
-                  user: User = Depends(auth_service.get_current_user)):
-    """
-        Retrieve a paginated list of contacts.
-
-        Parameters:
-        - limit (int): The maximum number of contacts to retrieve.
-        - offset (int): The offset for pagination.
-        - db (AsyncSession): The asynchronous database session.
-        - user (User): The authenticated User object.
-
-        Returns:
-        - List[ContactResponse]: A list of ContactResponse objects representing contacts.
-        """
-    contacts = await repository_contacts.get_contacts(db)
-    return contacts[offset:][:limit]
-
-
 @router.get("/{contact_id}", response_model=ContactResponse, description='No more than 10 requests per minute',
             dependencies=[Depends(RateLimiter(times=10, seconds=60))])
 async def get_contact(contact_id: int = Path(ge=1), db: AsyncSession = Depends(get_db),
@@ -150,14 +135,15 @@ async def delete_contact(contact_id: int = Path(ge=1), db: AsyncSession = Depend
 @router.get("/upcoming-birthdays/", response_model=List[ContactResponse],
             description='No more than 10 requests per minute',
             dependencies=[Depends(RateLimiter(times=10, seconds=60))])
-async def get_upcoming_birthdays(db: Session = Depends(get_db)):
+async def get_upcoming_birthdays(db: Session = Depends(get_db), user: User = Depends(auth_service.get_current_user)):
     """
         Retrieve the list of contacts with upcoming birthdays.
 
         Parameters:
         - db (Session): The database session.
+        - user (User): The authenticated User object.
 
         Returns:
         - List[ContactResponse]: A list of ContactResponse objects representing contacts with upcoming birthdays.
         """
-    return await repository_contacts.get_upcoming_birthdays(db)
+    return await repository_contacts.get_upcoming_birthdays(db, user)
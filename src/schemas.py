@@ -1,7 +1,5 @@
 from datetime import date, datetime
-from typing import Optional
-
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, ConfigDict, Field, EmailStr
 
 
 class UserSchema(BaseModel):
@@ -16,8 +14,7 @@ class UserResponseSchema(BaseModel):
     email: str
     avatar: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TokenModel(BaseModel):
@@ -32,11 +29,6 @@ class ContactSchema(BaseModel):
     email: str
     phone_number: str
     birthday: date
-    created_date: Optional[date]
-
-    def __init__(self, **data):
-        super().__init__(**data)
-        self.created_date = date.today()
 
 
 class ContactUpdateSchema(BaseModel):
@@ -45,11 +37,6 @@ class ContactUpdateSchema(BaseModel):
     email: str
     phone_number: str
     birthday: date
-    update_date: Optional[date]
-
-    def __init__(self, **data):
-        super().__init__(**data)
-        self.update_date = date.today()
 
 
 class ContactResponse(BaseModel):
@@ -63,8 +50,7 @@ class ContactResponse(BaseModel):
     update_date: datetime | None
     user: UserResponseSchema | None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserDb(BaseModel):
@@ -73,5 +59,4 @@ class UserDb(BaseModel):
     email: str
     avatar: str
 
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
@@ -1,3 +1,5 @@
+import hashlib
+import hmac
 from typing import Optional
 
 from jose import JWTError, jwt
@@ -16,14 +18,16 @@ class Auth:
       Authentication service class for managing user authentication and tokens.
 
       Attributes:
-      - pwd_context (CryptContext): Password hashing context.
+      - pwd_context (CryptContext): Password hashing context (argon2; bcrypt hashes are still verified).
       - SECRET_KEY (str): Secret key for token generation.
       - ALGORITHM (str): Token generation algorithm.
       - oauth2_scheme (OAuth2PasswordBearer): OAuth2 password bearer scheme.
+      - LOGIN_CACHE_TTL (int): Seconds a successful password check is remembered.
 
       Methods:
       - verify_password(plain_password, hashed_password): Verify a plain password against a hashed password.
       - get_password_hash(password): Generate a hashed password from a plain password.
+      - login_cache_key(email, plain_password, hashed_password): Build the Redis key for a verified login.
       - create_access_token(data, expires_delta): Generate a new access token.
       - create_refresh_token(data, expires_delta): Generate a new refresh token.
       - decode_refresh_token(refresh_token): Decode a refresh token and extract the email.
@@ -31,10 +35,11 @@ class Auth:
       - get_email_from_token(token): Extract the email from an email verification token.
       - get_current_user(token, db): Get the current user based on an access token.
       """
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    pwd_context = CryptContext(schemes=["argon2", "bcrypt"], deprecated="auto")
     SECRET_KEY = "secret_key"
     ALGORITHM = "HS256"
-    oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
+    oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
+    LOGIN_CACHE_TTL = 5
 
     def verify_password(self, plain_password, hashed_password):
         return self.pwd_context.verify(plain_password, hashed_password)
@@ -42,6 +47,11 @@ class Auth:
     def get_password_hash(self, password: str):
         return self.pwd_context.hash(password)
 
+    def login_cache_key(self, email: str, plain_password: str, hashed_password: str):
+        # Keyed HMAC so the plain password never reaches Redis; the stored hash ties it to the current password
+        digest = hmac.new(self.SECRET_KEY.encode(), f"{plain_password}:{hashed_password}".encode(), hashlib.sha256)
+        return f"login_ok:{email}:{digest.hexdigest()}"
+
     # define a function to generate a new access token
     async def create_access_token(self, data: dict, expires_delta: Optional[float] = None):
         to_encode = data.copy()
@@ -0,0 +1,86 @@
+import math
+import time
+import uuid
+
+from fastapi import HTTPException, Request, status
+from redis.exceptions import NoScriptError
+
+from src.database.cache import redis_client
+
+# Sliding-window limiter: drop hits older than the window, then admit the request only if fewer than
+# `limit` hits remain. Returns 0 when admitted, otherwise the milliseconds until the oldest hit expires.
+SLIDING_WINDOW_LUA = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', key, 0, now - window)
+if redis.call('ZCARD', key) >= limit then
+    local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+    return tonumber(oldest[2]) + window - now
+end
+redis.call('ZADD', key, now, ARGV[4])
+redis.call('PEXPIRE', key, window)
+return 0
+"""
+
+
+async def load_rate_limit_script(app) -> str:
+    """
+    Load the sliding-window script into Redis and store its SHA on app.state.
+
+    :param app: FastAPI: The application whose state keeps the script SHA
+    :return: The SHA1 of the loaded script
+    """
+    app.state.rate_limit_sha = await redis_client.script_load(SLIDING_WINDOW_LUA)
+    return app.state.rate_limit_sha
+
+
+class RateLimiter:
+    """
+      Dependency that allows no more than `times` requests per `seconds` for each client, method and path.
+
+      The check runs as a single EVALSHA of SLIDING_WINDOW_LUA, so it costs one round-trip and is atomic.
+
+      Attributes:
+      - times (int): The number of requests allowed in the window.
+      - milliseconds (int): The window length in milliseconds.
+      """
+
+    def __init__(self, times: int = 1, seconds: int = 0, milliseconds: int = 0):
+        self.times = times
+        self.milliseconds = milliseconds + 1000 * seconds
+
+    @staticmethod
+    def identifier(request: Request) -> str:
+        forwarded = request.headers.get("X-Forwarded-For")
+        ip = forwarded.split(",")[0] if forwarded else request.client.host
+        return f"rate_limit:{ip}:{request.method}:{request.scope['path']}"
+
+    async def _check_pipeline(self, key: str, now: int, member: str) -> int:
+        # Non-transactional: one batched write without MULTI/EXEC, at the cost of strict atomicity.
+        # ZCARD/ZRANGE are queued before ZADD, so they see the window without this request.
+        async with redis_client.pipeline(transaction=False) as pipe:
+            _, count, oldest, _, _ = await pipe.zremrangebyscore(key, 0, now - self.milliseconds) \
+                .zcard(key).zrange(key, 0, 0, withscores=True) \
+                .zadd(key, {member: now}).pexpire(key, self.milliseconds).execute()
+        if count < self.times:
+            return 0
+        # Rejected hits are not part of the window, same as in SLIDING_WINDOW_LUA
+        await redis_client.zrem(key, member)
+        return int(oldest[0][1]) + self.milliseconds - now
+
+    async def __call__(self, request: Request):
+        key = self.identifier(request)
+        now = int(time.time() * 1000)
+        member = f"{now}-{uuid.uuid4().hex}"
+        sha = getattr(request.app.state, "rate_limit_sha", None) or await load_rate_limit_script(request.app)
+        try:
+            retry_after = await redis_client.evalsha(sha, 1, key, now, self.milliseconds, self.times, member)
+        except NoScriptError:
+            # Script cache was flushed (e.g. Redis restart): answer via a pipeline and reload for next time
+            retry_after = await self._check_pipeline(key, now, member)
+            await load_rate_limit_script(request.app)
+        if retry_after:
+            raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail="Too Many Requests",
+                                headers={"Retry-After": str(math.ceil(retry_after / 1000))})
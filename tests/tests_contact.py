@@ -0,0 +1,48 @@
+from datetime import date
+
+from sqlalchemy.dialects import postgresql
+
+from src.repository.contact import upcoming_birthday_window, upcoming_birthday_filter
+
+
+def compile_sql(clause):
+    return str(clause.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+def test_upcoming_birthday_window_within_year():
+    assert upcoming_birthday_window(date(2023, 6, 10)) == (610, 617)
+
+
+def test_upcoming_birthday_window_wraps_new_year():
+    start, end = upcoming_birthday_window(date(2023, 12, 28))
+    assert (start, end) == (1228, 104)
+    assert end < start
+
+
+def test_upcoming_birthday_window_covers_feb_29():
+    # Non-leap year: Feb 28 is followed by Mar 1, yet a Feb 29 birthday still falls inside the window
+    start, end = upcoming_birthday_window(date(2023, 2, 25))
+    assert (start, end) == (225, 304)
+    assert start <= 229 <= end
+
+
+def test_upcoming_birthday_window_starts_on_feb_29():
+    assert upcoming_birthday_window(date(2024, 2, 29)) == (229, 307)
+
+
+def test_upcoming_birthday_filter_within_year_uses_between():
+    sql = compile_sql(upcoming_birthday_filter(date(2023, 6, 10)))
+    assert "BETWEEN 610 AND 617" in sql
+    assert " OR " not in sql
+
+
+def test_upcoming_birthday_filter_wraps_new_year_uses_or():
+    sql = compile_sql(upcoming_birthday_filter(date(2023, 12, 28)))
+    assert ">= 1228" in sql
+    assert "<= 104" in sql
+    assert " OR " in sql
+
+
+def test_upcoming_birthday_filter_matches_index_expression():
+    sql = compile_sql(upcoming_birthday_filter(date(2023, 6, 10)))
+    assert "date_part('month', contacts.birthday) * 100 + date_part('day', contacts.birthday)" in sql
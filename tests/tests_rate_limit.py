@@ -0,0 +1,106 @@
+import asyncio
+from types import SimpleNamespace
+
+import fakeredis.aioredis
+import pytest
+from fastapi import HTTPException
+from starlette.datastructures import State
+from starlette.requests import Request
+
+from src.services import rate_limit
+from src.services.rate_limit import RateLimiter, SLIDING_WINDOW_LUA
+
+UNKNOWN_SHA = "0" * 40
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(rate_limit, "redis_client", redis)
+    return redis
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = SimpleNamespace(now=1_000.0)
+    monkeypatch.setattr(rate_limit, "time", SimpleNamespace(time=lambda: clock.now))
+    return clock
+
+
+def make_request(app, method="GET", path="/api/contacts/"):
+    return Request({"type": "http", "method": method, "path": path, "headers": [], "client": ("10.0.0.1", 1234),
+                    "app": app})
+
+
+def make_app(sha=None):
+    app = SimpleNamespace(state=State())
+    if sha is not None:
+        app.state.rate_limit_sha = sha
+    return app
+
+
+async def hit(limiter, request):
+    try:
+        await limiter(request)
+    except HTTPException as e:
+        return e
+    return None
+
+
+def test_first_requests_admitted(fake_redis, clock):
+    async def scenario():
+        limiter, app = RateLimiter(times=3, seconds=60), make_app()
+        return [await hit(limiter, make_request(app)) for _ in range(3)]
+
+    assert asyncio.run(scenario()) == [None, None, None]
+
+
+def test_over_limit_gets_429_with_retry_after(fake_redis, clock):
+    async def scenario():
+        limiter, app = RateLimiter(times=3, seconds=60), make_app()
+        for _ in range(3):
+            assert await hit(limiter, make_request(app)) is None
+            clock.now += 10
+        return await hit(limiter, make_request(app))
+
+    error = asyncio.run(scenario())
+    assert error.status_code == 429
+    # Oldest hit at t=1000s expires at t=1060s; the rejected request came at t=1030s
+    assert error.headers["Retry-After"] == "30"
+
+
+def test_keys_are_separate_per_method_and_path(fake_redis, clock):
+    async def scenario():
+        limiter, app = RateLimiter(times=1, seconds=60), make_app()
+        return [
+            await hit(limiter, make_request(app, "GET", "/api/contacts/1")),
+            await hit(limiter, make_request(app, "PUT", "/api/contacts/1")),
+            await hit(limiter, make_request(app, "DELETE", "/api/contacts/1")),
+            await hit(limiter, make_request(app, "GET", "/api/contacts/2")),
+            await hit(limiter, make_request(app, "GET", "/api/contacts/1")),
+        ]
+
+    results = asyncio.run(scenario())
+    assert results[:4] == [None, None, None, None]
+    assert results[4].status_code == 429
+
+
+def test_noscript_fallback_answers_and_reloads_script(fake_redis, clock):
+    async def scenario():
+        limiter, app = RateLimiter(times=1, seconds=60), make_app(sha=UNKNOWN_SHA)
+        first = await hit(limiter, make_request(app))
+        reloaded_sha = app.state.rate_limit_sha
+        expected_sha = await fake_redis.script_load(SLIDING_WINDOW_LUA)
+        app.state.rate_limit_sha = UNKNOWN_SHA
+        clock.now += 15
+        second = await hit(limiter, make_request(app))
+        count = await fake_redis.zcard(RateLimiter.identifier(make_request(app)))
+        return first, reloaded_sha, expected_sha, second, count
+
+    first, reloaded_sha, expected_sha, second, count = asyncio.run(scenario())
+    assert first is None
+    assert reloaded_sha == expected_sha
+    assert second.status_code == 429
+    assert second.headers["Retry-After"] == "45"
+    # The rejected hit is not recorded in the window
+    assert count == 1